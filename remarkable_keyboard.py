@@ -14,6 +14,8 @@ Features:
 Requirements:
 - Linux with Wayland or X11 display server
 - python3-evdev system package (install with: sudo apt install python3-evdev)
+- Optional: python3-uvloop (0.18+) for a faster event loop
+- Optional: python3-asyncssh for a native SSH connection (falls back to the ssh client)
 - SSH access to reMarkable tablet
 - Root privileges to create input devices (or proper udev rules)
 
@@ -23,15 +25,16 @@ Usage:
 
 import asyncio
 import argparse
+import fcntl
 import os
 import signal
+import socket
 import struct
 import sys
 from typing import Optional
 
 # Import evdev with error handling
 try:
-    import evdev
     from evdev import UInput
     from evdev import ecodes
 except ImportError:
@@ -39,6 +42,48 @@ except ImportError:
     print("sudo apt install python3-evdev")
     sys.exit(1)
 
+# uvloop is optional; it provides a faster drop-in asyncio event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+if uvloop is not None and not hasattr(uvloop, 'run'):
+    uvloop = None  # uvloop.run() needs uvloop 0.18+
+
+# asyncssh is optional; without it we fall back to the system ssh client
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+# Keys the Type Folio can produce: the standard PC keyboard block (KEY_ESC..KEY_COMPOSE) with
+# function, navigation, volume and international (ISO/JIS) keys, plus F13-F24 and the media
+# and brightness keys. Registering every code up to KEY_MAX would also advertise mouse,
+# joystick and tablet buttons (BTN_*), which can make desktops misclassify the virtual keyboard.
+TYPE_FOLIO_KEYS = frozenset([
+    *range(ecodes.KEY_ESC, ecodes.KEY_COMPOSE + 1),
+    *range(ecodes.KEY_F13, ecodes.KEY_F24 + 1),
+    ecodes.KEY_NEXTSONG, ecodes.KEY_PLAYPAUSE, ecodes.KEY_PREVIOUSSONG,
+    ecodes.KEY_BRIGHTNESSDOWN, ecodes.KEY_BRIGHTNESSUP,
+])
+
+# reMarkable input_event: struct timeval (8 bytes), __u16 type, __u16 code, __s32 value
+_EVENT = struct.Struct('<QHHi')
+
+# Host input_event as written to /dev/uinput: struct timeval (two longs), type, code, value.
+# The kernel timestamps uinput events itself, so the timeval is left zeroed. The type,
+# code and value fields match the reMarkable's on little-endian hosts (x86_64, arm64).
+_UINPUT_EVENT = struct.Struct('@llHHi')
+_TIME_PADDING = bytes(_UINPUT_EVENT.size - 8)
+_SYN_REPORT = _UINPUT_EVENT.pack(0, 0, 0, 0, 0)  # EV_SYN / SYN_REPORT
+
+# Maximum number of bytes taken from the SSH stream per read (64 events)
+_READ_SIZE = _EVENT.size * 64
+
+# Buffer sizes for the ssh client's stdout (StreamReader limit and kernel pipe size)
+_STREAM_LIMIT = 1 << 20
+_PIPE_SIZE = 1 << 20
+
 
 class RemarkableKeyboard:
     def __init__(self, rm_host: str = "root@10.11.99.1", verbose: bool = False):
@@ -47,15 +92,28 @@ class RemarkableKeyboard:
         self.uinput: Optional[UInput] = None
         self.verbose = verbose
         
+        # Split "user@host" for the native SSH client
+        user, _, host = rm_host.rpartition('@')
+        self._ssh_user = user or None
+        self._ssh_host = host
+        
         self._running = False
         self._process: Optional[asyncio.subprocess.Process] = None
+        self._conn = None  # asyncssh connection, when used
+        
+        # Key names for verbose output, resolved once (codes with aliases map to a list)
+        self._key_names = {
+            code: name[0] if isinstance(name, list) else name
+            for code, name in ecodes.KEY.items()
+        }
+        self._log_queue: Optional[asyncio.Queue] = None
 
     def create_virtual_device(self):
         """Create a virtual keyboard input device."""
         # Define capabilities for a keyboard device
         # We need to support all the keys that the reMarkable Type Folio can generate
         capabilities = {
-            ecodes.EV_KEY: list(range(ecodes.KEY_ESC, ecodes.KEY_MAX + 1)),
+            ecodes.EV_KEY: sorted(TYPE_FOLIO_KEYS),
         }
         
         try:
@@ -79,82 +137,194 @@ class RemarkableKeyboard:
             print("3. No conflicting input devices")
             sys.exit(1)
 
+    def set_realtime_priority(self):
+        """Schedule this process as real-time (SCHED_FIFO) so CPU load does not delay key events."""
+        try:
+            # SCHED_RESET_ON_FORK keeps a spawned ssh client at normal priority
+            os.sched_setscheduler(0, os.SCHED_FIFO | os.SCHED_RESET_ON_FORK, os.sched_param(20))
+            if self.verbose:
+                print("Real-time scheduling enabled (SCHED_FIFO)")
+        except (AttributeError, OSError) as e:
+            if self.verbose:
+                print(f"Warning: Could not enable real-time scheduling: {e}")
+
+    async def connect_native(self):
+        """Open a native SSH connection, or return None to fall back to the ssh client."""
+        try:
+            return await asyncssh.connect(
+                self._ssh_host,
+                username=self._ssh_user,
+                known_hosts=None,
+                connect_timeout=5,
+                tcp_keepalive=True
+            )
+        except (asyncssh.DisconnectError, asyncssh.KeyImportError) as e:
+            # asyncssh cannot prompt for a password or key passphrase; the ssh client can
+            print(f"Native SSH connection failed ({e}), falling back to the ssh client")
+            return None
+
     async def read_remarkable_data(self):
         """Read keyboard data from reMarkable tablet via SSH connection."""
-        command = f"ssh -o ConnectTimeout=5 -o StrictHostKeyChecking=no {self.rm_host} cat {self.device_path}"
-        
         if self.verbose:
             print(f"Connecting to reMarkable at {self.rm_host}...")
         
+        stderr_task = None
         try:
-            self._process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            if self.verbose:
-                print("Connected! Use your Type Folio keyboard on the reMarkable tablet.")
-                print("Press Ctrl+C to stop.")
-            
-            # Read data in 16-byte chunks (reMarkable input event structure)
-            while self._running and self._process.returncode is None:
-                try:
-                    data = await asyncio.wait_for(self._process.stdout.read(16), timeout=1.0)
-                    
-                    if len(data) != 16:
-                        if len(data) == 0:
-                            if self.verbose:
-                                print("Connection closed by reMarkable")
-                            break
-                        continue
-                    
-                    # Parse reMarkable input event structure
-                    # Based on Linux input_event structure
-                    timestamp = data[0:8]  # struct timeval (8 bytes)
-                    type_code = data[8:10]  # __u16 type (2 bytes)
-                    code = data[10:12]     # __u16 code (2 bytes)
-                    value = data[12:16]    # __s32 value (4 bytes)
-                    
-                    # Unpack the values
-                    event_type = struct.unpack('<H', type_code)[0]
-                    event_code = struct.unpack('<H', code)[0]
-                    event_value = struct.unpack('<i', value)[0]
-                    
-                    # Process key events (type 1) for keyboard presses
-                    if event_type == 1:  # EV_KEY
-                        # Direct pass-through of keyboard events
+            conn = await self.connect_native() if asyncssh is not None else None
+            if conn is not None:
+                # Native SSH client: events are read straight from the SSH channel,
+                # without an ssh subprocess and pipe in between
+                async with conn:
+                    self._conn = conn
+                    # Disable Nagle's algorithm so small key events are never held back
+                    sock = conn.get_extra_info('socket')
+                    if sock is not None:
+                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                         if self.verbose:
-                            key_name = evdev.ecodes.KEY.get(event_code, f"Unknown({event_code})")
-                            state = "PRESSED" if event_value == 1 else "RELEASED" if event_value == 0 else "REPEAT"
-                            print(f"Key {key_name} {state}")
-                        
-                        # Forward the event to the virtual keyboard
-                        self.uinput.write(ecodes.EV_KEY, event_code, event_value)
-                        self.uinput.syn()
+                            nodelay = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+                            print(f"TCP_NODELAY: {nodelay}")
+                    
+                    # stderr is discarded: unread channel data would eventually stall stdout too
+                    async with conn.create_process(
+                        f"cat {self.device_path}",
+                        encoding=None,
+                        stderr=asyncssh.DEVNULL
+                    ) as process:
+                        await self.forward_events(process)
+            else:
+                # -T: no PTY, so the binary event stream is never run through a line discipline.
+                # Share one master connection between runs so restarts skip the SSH handshake.
+                # ssh is started directly (no shell), so the host is never parsed by a shell
+                self._process = await asyncio.create_subprocess_exec(
+                    "ssh", "-T",
+                    "-o", "ConnectTimeout=5",
+                    "-o", "StrictHostKeyChecking=no",
+                    "-o", "IPQoS=lowdelay",
+                    "-o", "ControlMaster=auto",
+                    "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+                    "-o", "ControlPersist=600",
+                    self.rm_host, "cat", self.device_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=_STREAM_LIMIT
+                )
                 
-                except asyncio.TimeoutError:
-                    # Timeout is normal, just continue
-                    continue
-                except Exception as e:
-                    if self.verbose:
-                        print(f"Error reading data: {e}")
-                    break
+                # A larger pipe lets bursts of events accumulate and be drained in one wakeup
+                if hasattr(fcntl, 'F_SETPIPE_SZ'):
+                    try:
+                        pipe = self._process.stdout._transport.get_extra_info('pipe')
+                        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, _PIPE_SIZE)
+                    except (AttributeError, OSError):
+                        pass  # Keep the default pipe size
+                
+                # Keep stderr drained, a full pipe would block ssh and freeze the event stream
+                stderr_task = asyncio.create_task(self.drain_stderr(self._process.stderr))
+                await self.forward_events(self._process)
                     
         except Exception as e:
             print(f"ERROR: Failed to connect to reMarkable: {e}")
         finally:
-            if self._process:
+            if stderr_task:
+                stderr_task.cancel()
+            self._conn = None
+            if self._process and self._process.returncode is None:
                 self._process.kill()
                 await self._process.wait()
 
+    async def drain_stderr(self, stream: asyncio.StreamReader):
+        """Consume the ssh client's stderr, showing it in verbose mode."""
+        async for line in stream:
+            if self.verbose:
+                print(f"ssh: {line.decode(errors='replace').rstrip()}")
+
+    async def forward_events(self, process):
+        """Forward key events from the remote `cat` process to the virtual keyboard."""
+        if self.verbose:
+            print("Connected! Use your Type Folio keyboard on the reMarkable tablet.")
+            print("Press Ctrl+C to stop.")
+        
+        # Read events in batches; a trailing partial event is kept for the next read.
+        # Reads block until data arrives, stop() ends them by closing the connection.
+        pending = b''
+        
+        # Bind hot-loop lookups to locals once
+        os_write = os.write
+        uinput_fd = self.uinput.fd
+        log_key = self._log_queue.put_nowait if self._log_queue else None
+        
+        while self._running:
+            try:
+                data = await process.stdout.read(_READ_SIZE)
+                
+                if len(data) == 0:
+                    if self.verbose:
+                        print("Connection closed by reMarkable")
+                    break
+                
+                if pending:
+                    data = pending + data
+                end = len(data) - len(data) % _EVENT.size
+                pending = data[end:]
+                
+                view = memoryview(data)
+                out = bytearray()
+                frame_keys = set()
+                for offset in range(0, end, _EVENT.size):
+                    # Only key events (type 1) are forwarded; the type is a little-endian
+                    # __u16 below 256, so its low byte identifies SYN/MSC events to skip
+                    if data[offset + 8] != 1:  # EV_KEY
+                        continue
+                    
+                    # Events for a key already in this frame (e.g. press and release during
+                    # fast typing) start a new frame, so each frame holds one state per key
+                    key_code = data[offset + 10:offset + 12]
+                    if key_code in frame_keys:
+                        out += _SYN_REPORT
+                        frame_keys.clear()
+                    frame_keys.add(key_code)
+                    
+                    # Direct pass-through of keyboard events: type, code and value keep
+                    # their layout, only the timestamp is widened to the host's timeval
+                    out += _TIME_PADDING
+                    out += view[offset + 8:offset + 16]
+                    
+                    if log_key is not None:
+                        log_key(_EVENT.unpack_from(view, offset)[2:])
+                
+                # All key events of the batch and their SYN_REPORTs go out in one write
+                if out:
+                    out += _SYN_REPORT
+                    os_write(uinput_fd, out)
+            
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error reading data: {e}")
+                break
+
+    async def log_key_events(self):
+        """Print forwarded key events (verbose mode) outside of the forwarding loop."""
+        while True:
+            event_code, event_value = await self._log_queue.get()
+            key_name = self._key_names.get(event_code, f"Unknown({event_code})")
+            state = "PRESSED" if event_value == 1 else "RELEASED" if event_value == 0 else "REPEAT"
+            if event_code not in TYPE_FOLIO_KEYS:
+                state += " (not supported by the virtual keyboard)"
+            print(f"Key {key_name} {state}")
+
     async def run(self):
         """Main run loop - connects to reMarkable and starts processing input events."""
         self._running = True
+        log_task = None
         
         try:
             # Create virtual input device
             self.create_virtual_device()
+            self.set_realtime_priority()
+            
+            # Key events are printed by a separate task so forwarding never waits on the terminal
+            if self.verbose:
+                self._log_queue = asyncio.Queue()
+                log_task = asyncio.create_task(self.log_key_events())
             
             # Start reading data
             await self.read_remarkable_data()
@@ -162,11 +332,26 @@ class RemarkableKeyboard:
         except KeyboardInterrupt:
             print("\nShutting down...")
         finally:
+            if log_task:
+                log_task.cancel()
             self.cleanup()
 
+    def stop(self):
+        """Stop reading from the reMarkable; run() then returns and cleans up."""
+        self._running = False
+        
+        # Closing the SSH side wakes the pending read with EOF
+        if self._conn:
+            self._conn.close()
+        if self._process and self._process.returncode is None:
+            try:
+                self._process.terminate()
+            except ProcessLookupError:
+                pass  # Already exited
+
     def cleanup(self):
         """Clean up resources and close virtual input device."""
-        self._running = False
+        self.stop()
         
         if self.uinput:
             self.uinput.close()
@@ -174,11 +359,10 @@ class RemarkableKeyboard:
                 print("Virtual keyboard device closed")
 
 
-def signal_handler(signum, frame, keyboard_instance):
+def signal_handler(keyboard_instance):
     """Handle Ctrl+C gracefully."""
     print("\nReceived interrupt signal...")
-    keyboard_instance.cleanup()
-    sys.exit(0)
+    keyboard_instance.stop()
 
 
 async def main():
@@ -203,8 +387,9 @@ async def main():
     # Create and run the virtual keyboard
     keyboard = RemarkableKeyboard(args.host, verbose=args.verbose)
     
-    # Setup signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, lambda s, f: signal_handler(s, f, keyboard))
+    # Setup signal handler for graceful shutdown, run from within the event loop
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, signal_handler, keyboard)
     
     await keyboard.run()
 
@@ -212,4 +397,7 @@ async def main():
 if __name__ == "__main__":
     print("reMarkable Keyboard - Virtual Keyboard from reMarkable Tablet")
     print("===================================================================")
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -10,15 +10,17 @@ Features:
 - Hover detection (pen movement without touching surface)
 - Click detection when pen touches the surface (pressure > 0)
 - Pressure sensitivity support
-- Configurable mouse sensitivity
+- Absolute positioning: the cursor follows the pen directly
 - Support for reMarkable 1.0 and 2.0
-- Proper aspect ratio scaling
+- Full-screen mapping, or aspect-ratio-preserving (letterboxed) with --uniform-scaling
 - Works with Wayland and X11 desktop environments
 - Default flipped orientation (180 degrees) with option to restore original
 
 Requirements:
 - Linux with Wayland or X11 display server (tested under Ubuntu)
 - python3-evdev system package (install with: sudo apt install python3-evdev)
+- Optional: python3-uvloop (0.18+) for a faster event loop
+- Optional: python3-asyncssh for a native SSH connection (falls back to the ssh client)
 - SSH access to reMarkable tablet
 - Root privileges to create input devices (or proper udev rules)
 
@@ -30,11 +32,14 @@ Note: Default orientation is now flipped 180 degrees. Use --flip/-f to restore o
 
 import asyncio
 import argparse
+import glob
 import os
+import re
 import signal
 import struct
 import subprocess
 import sys
+import time
 from typing import Optional, Tuple
 
 # Import evdev with error handling
@@ -43,21 +48,82 @@ try:
     from evdev import UInput
     from evdev import ecodes
     from evdev import AbsInfo
+    from evdev.ecodes import (
+        EV_KEY, EV_ABS, ABS_X, ABS_Y, ABS_PRESSURE,
+        BTN_LEFT, BTN_RIGHT, BTN_STYLUS, BTN_TOOL_PEN, BTN_TOUCH,
+    )
 except ImportError:
     print("ERROR: python3-evdev library is required. Install with:")
     print("sudo apt install python3-evdev")
     sys.exit(1)
 
+# uvloop is optional; it provides a faster drop-in asyncio event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+if uvloop is not None and not hasattr(uvloop, 'run'):
+    uvloop = None  # uvloop.run() needs uvloop 0.18+
+
+# asyncssh is optional; without it we fall back to the system ssh client
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+# reMarkable input_event: struct timeval (8 bytes, skipped), __u16 type, __u16 code, __s32 value
+_EVENT = struct.Struct('<8xHHi')
+
+# Host input_event as written to /dev/uinput: struct timeval (two longs), type, code, value.
+# The kernel timestamps uinput events itself, so the timeval is left zeroed.
+_UINPUT_EVENT = struct.Struct('@llHHi')
+
+# Largest frame written to the virtual device: tool, X, Y, pressure, stylus, touch + SYN_REPORT
+_MAX_FRAME_EVENTS = 8
+
+# Maximum number of bytes taken from the SSH stream per read (256 events)
+_READ_SIZE = _EVENT.size * 256
+
+# Minimum interval between hover updates (250 Hz); faster updates cannot be displayed anyway
+_HOVER_INTERVAL_NS = 4_000_000
+
+# Current mode in `xrandr --current` output, e.g. "   1920x1080     60.00*+  59.93"
+_XRANDR_CURRENT_MODE = re.compile(rb'^\s+(\d+)x(\d+)\S*\s.*\*', re.MULTILINE)
+
 
 class RemarkableMouse:
+    # Fixed attribute layout: no per-instance __dict__ for the state read on every sample
+    __slots__ = (
+        'rm_host', '_ssh_user', '_ssh_host', 'remarkable_version', 'device_path',
+        'uinput', '_uifd', '_outbuf', '_outview',
+        '_is_pen_mode', '_has_pressure', '_has_tool_pen', 'verbose', 'flip_orientation',
+        'x', 'y', 'pressure', 'button_pressed', '_last_touching', '_last_button',
+        '_sent_tool_pen', '_sent_x', '_sent_y', '_sent_pressure',
+        '_last_screen_pos', '_last_emit_ns', '_held_hover', '_hover_timer', 'mouse_button_pressed', 'uniform_scaling',
+        'rm_width', 'rm_height', 'screen_width', 'screen_height',
+        '_scale_x', '_scale_y', '_offset_x', '_offset_y', '_max_x', '_max_y', 'map_coordinates',
+        '_running', '_process', '_stream_closed', '_pending', '_frame_changed',
+    )
+    
     def __init__(self, rm_host: str = "root@10.11.99.1", remarkable_version: int = 2, verbose: bool = False, flip_orientation: bool = False):
         self.rm_host = rm_host
+        # Split "user@host" for the native SSH client
+        user, _, host = rm_host.rpartition('@')
+        self._ssh_user = user or None
+        self._ssh_host = host
         # reMarkable version: 1 for reMarkable 1.0, 2 for reMarkable 2.0, 3+ for future versions
         if remarkable_version not in [1, 2]:
             raise ValueError(f"Invalid reMarkable version: {remarkable_version}. Supported versions: 1, 2")
         self.remarkable_version = remarkable_version
         self.device_path: Optional[str] = None
         self.uinput: Optional[UInput] = None
+        self._uifd = -1  # /dev/uinput file descriptor, set with the device
+        # Each frame is packed into this buffer and written with a single os.write
+        self._outbuf = bytearray(_UINPUT_EVENT.size * _MAX_FRAME_EVENTS)
+        self._outview = memoryview(self._outbuf)
+        self._is_pen_mode = False  # Stylus (vs. mouse) events, decided with the device
+        self._has_pressure = False  # Device supports ABS_PRESSURE
+        self._has_tool_pen = False  # Device supports BTN_TOOL_PEN
         self.verbose = verbose
         self.flip_orientation = flip_orientation
         
@@ -65,25 +131,34 @@ class RemarkableMouse:
         self.x = 0
         self.y = 0
         self.pressure = 0
-        self.is_touching = False
-        self.was_touching = False
-        
-        # Button state
         self.button_pressed = False
-        self.was_button_pressed = False
         
-        # Mouse state for relative movement
-        self.last_x = 0
-        self.last_y = 0
+        # Touch and button state of the last processed frame, for edge detection
+        self._last_touching = False
+        self._last_button = False
+        
+        # Last values written to the virtual device (only changes are sent)
+        self._sent_tool_pen = False
+        self._sent_x = -1
+        self._sent_y = -1
+        self._sent_pressure = -1
+        
+        # Last frame sent, for throttling hover updates
+        self._last_screen_pos = (-1, -1)
+        self._last_emit_ns = 0
+        self._held_hover = None  # Latest throttled hover frame, sent when the interval ends
+        self._hover_timer: Optional[asyncio.TimerHandle] = None
+        
+        # Mouse button state
         self.mouse_button_pressed = False
         
-        # Mouse sensitivity and scaling
-        self.mouse_sensitivity = 1.0  # Adjustable sensitivity multiplier
-        self.uniform_scaling = True   # Use uniform scaling for both axes
+        # Scaling
+        self.uniform_scaling = False  # Keep the tablet's aspect ratio (letterboxed) instead of covering the screen
         
-        # reMarkable tablet coordinate system dimensions (standard for both versions)
-        self.rm_width = 15725  # reMarkable coordinate system width
-        self.rm_height = 20967  # reMarkable coordinate system height
+        # reMarkable digitizer axis extents (same for both versions): ABS_X runs along the
+        # long edge of the tablet, ABS_Y along the short edge
+        self.rm_width = 20967  # ABS_X maximum
+        self.rm_height = 15725  # ABS_Y maximum
         
         # Screen dimensions (auto-detected using xrandr)
         self.screen_width = 1920
@@ -91,7 +166,14 @@ class RemarkableMouse:
         
         self._running = False
         self._process: Optional[asyncio.subprocess.Process] = None
-
+        self._stream_closed: Optional[asyncio.Future] = None
+        
+        # Event stream state carried between batches
+        self._pending = b''  # Trailing partial event
+        self._frame_changed = False  # Stylus state changed since the last SYN_REPORT
+        
+        # Scale factors derived from the dimensions above (see update_scaling)
+        self.update_scaling()
 
     def get_device_path(self) -> str:
         """Get the input device path based on reMarkable version."""
@@ -109,43 +191,85 @@ class RemarkableMouse:
             result = subprocess.run(
                 ["xrandr", "--current"],
                 capture_output=True,
-                text=True
+                timeout=2.0
             )
             
-            for line in result.stdout.split('\n'):
-                if '*' in line and '+' in line:
-                    # Parse line like "1920x1080     60.00*+  59.93"
-                    resolution = line.split()[0]
-                    width, height = map(int, resolution.split('x'))
-                    if self.verbose:
-                        print(f"Detected screen resolution: {width}x{height}")
-                    return width, height
+            match = _XRANDR_CURRENT_MODE.search(result.stdout)
+            if match:
+                width, height = int(match[1]), int(match[2])
+                if self.verbose:
+                    print(f"Detected screen resolution: {width}x{height}")
+                return width, height
         except Exception as e:
             if self.verbose:
                 print(f"Warning: Could not detect screen resolution: {e}")
         
+        # Without xrandr (e.g. Wayland without XWayland), ask the kernel's DRM subsystem
+        resolution = self.read_drm_resolution()
+        if resolution:
+            if self.verbose:
+                print(f"Detected screen resolution (DRM): {resolution[0]}x{resolution[1]}")
+            return resolution
+        
         # Fallback to default
         if self.verbose:
             print(f"Using default resolution: {self.screen_width}x{self.screen_height}")
         return self.screen_width, self.screen_height
 
+    def read_drm_resolution(self) -> Optional[Tuple[int, int]]:
+        """Read the preferred mode of the first connected display from /sys/class/drm."""
+        for connector in sorted(glob.glob('/sys/class/drm/card*-*')):
+            try:
+                with open(os.path.join(connector, 'status')) as f:
+                    if f.read().strip() != 'connected':
+                        continue
+                with open(os.path.join(connector, 'modes')) as f:
+                    mode = f.readline()  # Preferred mode first, e.g. "1920x1080"
+            except OSError:
+                continue
+            
+            match = re.match(r'(\d+)x(\d+)', mode)
+            if match:
+                return int(match[1]), int(match[2])
+        return None
+
+    def update_scaling(self):
+        """Precompute the scale factors, bounds and coordinate mapping used for every stylus sample."""
+        # By default the whole tablet maps onto the whole screen
+        self._scale_x = self.screen_width / self.rm_width
+        self._scale_y = self.screen_height / self.rm_height
+        self._offset_x = self._offset_y = 0.0
+        if self.uniform_scaling:
+            # Scale both axes by the limiting dimension to maintain the aspect ratio,
+            # and center the mapped area on the screen (letterbox)
+            self._scale_x = self._scale_y = min(self._scale_x, self._scale_y)
+            self._offset_x = (self.screen_width - self.rm_width * self._scale_x) / 2
+            self._offset_y = (self.screen_height - self.rm_height * self._scale_y) / 2
+        self._max_x = self.screen_width - 1
+        self._max_y = self.screen_height - 1
+        # The orientation is fixed for the run: bind the matching mapping once
+        # instead of branching on flip_orientation for every sample
+        self.map_coordinates = self._map_original if self.flip_orientation else self._map_flipped
+
     def create_virtual_device(self):
         """Create a virtual mouse/stylus input device with pressure sensitivity and hover detection."""
-        # Update screen dimensions
+        # Update screen dimensions and the scale factors derived from them
         self.screen_width, self.screen_height = self.detect_screen_resolution()
+        self.update_scaling()
         
-        # Define capabilities for a pressure-sensitive mouse/stylus device
+        # Define capabilities for an absolute pointer device (like a USB tablet in a VM).
+        # No BTN_STYLUS: with absolute X/Y it would make udev classify the device as a
+        # graphics tablet, which libinput expects to report pen proximity and tip events.
         capabilities = {
             ecodes.EV_KEY: [
                 ecodes.BTN_LEFT,        # Left mouse button
                 ecodes.BTN_RIGHT,       # Right mouse button
                 ecodes.BTN_MIDDLE,      # Middle mouse button
-                ecodes.BTN_STYLUS,      # Stylus button for right-click
             ],
-            ecodes.EV_REL: [
-                ecodes.REL_X,           # Relative X movement
-                ecodes.REL_Y,           # Relative Y movement
-                ecodes.REL_WHEEL,       # Mouse wheel (we'll use this for pressure)
+            ecodes.EV_ABS: [
+                # Absolute position in screen pixels
+                (ecodes.ABS_X, AbsInfo(value=0, min=0, max=self.screen_width-1, fuzz=0, flat=0, resolution=0)),
+                (ecodes.ABS_Y, AbsInfo(value=0, min=0, max=self.screen_height-1, fuzz=0, flat=0, resolution=0)),
             ],
         }
         
@@ -159,6 +283,7 @@ class RemarkableMouse:
                 version=0x0001,
                 bustype=ecodes.BUS_VIRTUAL
             )
+            created_capabilities = capabilities
             if self.verbose:
                 print("Virtual mouse/stylus device created successfully")
                 print(f"Device: {self.uinput.device.path}")
@@ -181,6 +306,7 @@ class RemarkableMouse:
                     name='reMarkable Mouse',
                     bustype=ecodes.BUS_VIRTUAL
                 )
+                created_capabilities = fallback_capabilities
                 if self.verbose:
                     print("Fallback virtual device created successfully")
                     print(f"Device: {self.uinput.device.path}")
@@ -193,292 +319,370 @@ class RemarkableMouse:
                 print("2. /dev/uinput exists and is accessible")
                 print("3. No conflicting input devices")
                 sys.exit(1)
-
-    def map_coordinates(self, rm_x: int, rm_y: int) -> Tuple[int, int]:
-        """Map reMarkable coordinates to screen coordinates with proper aspect ratio."""
-        # Apply orientation flipping - by default we flip (180 degree rotation)
-        # When --flip is used, we restore the original orientation
-        if not self.flip_orientation:  # Default behavior: flipped orientation
-            # Flip coordinates (180 degree rotation around center)
-            flipped_x = self.rm_width - rm_x
-            flipped_y = self.rm_height - rm_y
-        else:  # When --flip flag is used: original orientation
-            flipped_x = rm_x
-            flipped_y = rm_y
         
-        # Calculate aspect ratios
-        rm_aspect = self.rm_width / self.rm_height  # reMarkable aspect ratio
-        screen_aspect = self.screen_width / self.screen_height  # Screen aspect ratio
+        # Frames are written straight to the uinput file descriptor
+        self._uifd = self.uinput.fd
         
-        # Use uniform scaling to maintain aspect ratio
-        # Scale based on the limiting dimension
-        if rm_aspect > screen_aspect:
-            # reMarkable is wider relative to height, scale by width
-            scale = self.screen_width / self.rm_width
-            screen_x = int(flipped_x * scale)
-            screen_y = int(flipped_y * scale)
-        else:
-            # reMarkable is taller relative to width, scale by height  
-            scale = self.screen_height / self.rm_height
-            screen_x = int(flipped_x * scale)
-            screen_y = int(flipped_y * scale)
+        # Pen mode is selected by a device name containing "Pen". Neither 'reMarkable Virtual
+        # Mouse' nor the fallback 'reMarkable Mouse' does, so both devices run in mouse mode.
+        self._is_pen_mode = 'Pen' in getattr(self.uinput, 'name', '')
+        
+        # Optional pen capabilities; events for codes the device lacks are not sent
+        abs_codes = [code for code, _ in created_capabilities.get(ecodes.EV_ABS, [])]
+        self._has_pressure = ecodes.ABS_PRESSURE in abs_codes
+        self._has_tool_pen = ecodes.BTN_TOOL_PEN in created_capabilities.get(ecodes.EV_KEY, [])
+
+    def _map_flipped(self, rm_x: int, rm_y: int) -> Tuple[int, int]:
+        """Map reMarkable coordinates to screen coordinates, rotated by 180 degrees (default)."""
+        # Flip coordinates (180 degree rotation around center), then scale to screen pixels
+        screen_x = int(self._offset_x + (self.rm_width - rm_x) * self._scale_x)
+        screen_y = int(self._offset_y + (self.rm_height - rm_y) * self._scale_y)
         
         # Ensure coordinates are within bounds
-        screen_x = max(0, min(screen_x, self.screen_width - 1))
-        screen_y = max(0, min(screen_y, self.screen_height - 1))
+        max_x = self._max_x
+        max_y = self._max_y
+        screen_x = 0 if screen_x < 0 else max_x if screen_x > max_x else screen_x
+        screen_y = 0 if screen_y < 0 else max_y if screen_y > max_y else screen_y
         
         return screen_x, screen_y
 
-    def calculate_relative_movement(self, current_x: int, current_y: int) -> Tuple[int, int]:
-        """Calculate relative movement with floating-point accumulation for smooth fine motion."""
-        # Apply coordinate flipping before calculating relative movement
-        if not self.flip_orientation:  # Default behavior: flipped orientation
-            flipped_current_x = self.rm_width - current_x
-            flipped_current_y = self.rm_height - current_y
-        else:  # When --flip flag is used: original orientation
-            flipped_current_x = current_x
-            flipped_current_y = current_y
+    def _map_original(self, rm_x: int, rm_y: int) -> Tuple[int, int]:
+        """Map reMarkable coordinates to screen coordinates in the original orientation (--flip)."""
+        # Scale to screen pixels
+        screen_x = int(self._offset_x + rm_x * self._scale_x)
+        screen_y = int(self._offset_y + rm_y * self._scale_y)
         
-        if not hasattr(self, 'last_x') or self.last_x == 0:
-            self.last_x = flipped_current_x
-            self.last_y = flipped_current_y
-            self._rel_x_accum = 0.0
-            self._rel_y_accum = 0.0
-            return 0, 0
-
-        # Calculate raw movement in reMarkable coordinates (after flipping)
-        raw_rel_x = flipped_current_x - self.last_x
-        raw_rel_y = flipped_current_y - self.last_y
-
-        if self.uniform_scaling:
-            scale_x = self.screen_width / self.rm_width
-            scale_y = self.screen_height / self.rm_height
-            scale = min(scale_x, scale_y) * self.mouse_sensitivity
-            move_x = raw_rel_x * scale
-            move_y = raw_rel_y * scale
-        else:
-            scale_x = (self.screen_width / self.rm_width) * self.mouse_sensitivity
-            scale_y = (self.screen_height / self.rm_height) * self.mouse_sensitivity
-            move_x = raw_rel_x * scale_x
-            move_y = raw_rel_y * scale_y
-
-        # Accumulate fractional movement
-        if not hasattr(self, '_rel_x_accum'):
-            self._rel_x_accum = 0.0
-        if not hasattr(self, '_rel_y_accum'):
-            self._rel_y_accum = 0.0
-        self._rel_x_accum += move_x
-        self._rel_y_accum += move_y
-
-        rel_x = int(round(self._rel_x_accum))
-        rel_y = int(round(self._rel_y_accum))
-
-        # Remove the sent integer part, keep the fractional remainder
-        self._rel_x_accum -= rel_x
-        self._rel_y_accum -= rel_y
-
-        # Update last position (using flipped coordinates)
-        self.last_x = flipped_current_x
-        self.last_y = flipped_current_y
-
-        return rel_x, rel_y
+        # Ensure coordinates are within bounds
+        max_x = self._max_x
+        max_y = self._max_y
+        screen_x = 0 if screen_x < 0 else max_x if screen_x > max_x else screen_x
+        screen_y = 0 if screen_y < 0 else max_y if screen_y > max_y else screen_y
+        
+        return screen_x, screen_y
 
-    def process_stylus_event(self, x: int, y: int, pressure: int):
+    def process_stylus_event(self, x: int, y: int, pressure: int, button: bool):
         """Process stylus event and send to virtual device."""
-        if not self.uinput:
-            return
+        if self._uifd < 0:
+            return  # No device yet, or already closed by cleanup()
+        buf = self._outbuf
+        pack_into = _UINPUT_EVENT.pack_into
+        size = _UINPUT_EVENT.size
+        n = 0  # Bytes of the frame packed so far
             
         # Map coordinates
         screen_x, screen_y = self.map_coordinates(x, y)
         
-        # Update stylus state
-        self.x, self.y, self.pressure = x, y, pressure
-        self.was_touching = self.is_touching
-        self.is_touching = pressure > 0
+        # Edges against the last processed frame
+        touching = pressure > 0
+        was_touching = self._last_touching
+        just_touched = touching and not was_touching
+        just_released = was_touching and not touching
+        self._last_touching = touching
+        button_changed = button != self._last_button
+        self._last_button = button
         
-        # Check if we have stylus capabilities or fallback to mouse mode
-        device_name = getattr(self.uinput, 'name', 'Unknown')
-        is_pen_mode = 'Pen' in device_name
+        # Hover frames are throttled: dropped if the pointer stays on the same pixel, held back
+        # if the previous frame went out less than 4 ms ago. Touch and button changes always pass.
+        now = time.monotonic_ns()
+        screen_pos = (screen_x, screen_y)
+        if not touching and not was_touching and not button_changed:
+            if screen_pos == self._last_screen_pos:
+                self.cancel_held_hover()
+                return
+            elapsed = now - self._last_emit_ns
+            if elapsed < _HOVER_INTERVAL_NS:
+                # Keep the latest position so the cursor does not stop short when the pen does
+                self._held_hover = (x, y, pressure, button)
+                if self._hover_timer is None:
+                    delay = (_HOVER_INTERVAL_NS - elapsed) / 1e9
+                    self._hover_timer = asyncio.get_running_loop().call_later(delay, self.flush_held_hover)
+                return
+        self.cancel_held_hover()
+        self._last_screen_pos = screen_pos
+        self._last_emit_ns = now
         
-        if is_pen_mode:
+        # Stylus or mouse mode (fixed when the device was created)
+        if self._is_pen_mode:
             # Full stylus mode with hover detection
-            # Always send stylus tool presence (for hovering)
-            self.uinput.write(ecodes.EV_KEY, ecodes.BTN_TOOL_PEN, 1)
+            # Only values that changed since the last frame are written
+            # Send stylus tool presence once (for hovering)
+            if self._has_tool_pen and not self._sent_tool_pen:
+                pack_into(buf, n, 0, 0, EV_KEY, BTN_TOOL_PEN, 1)
+                n += size
+                self._sent_tool_pen = True
             
             # Send absolute position
-            self.uinput.write(ecodes.EV_ABS, ecodes.ABS_X, screen_x)
-            self.uinput.write(ecodes.EV_ABS, ecodes.ABS_Y, screen_y)
+            if screen_x != self._sent_x:
+                pack_into(buf, n, 0, 0, EV_ABS, ABS_X, screen_x)
+                n += size
+                self._sent_x = screen_x
+            if screen_y != self._sent_y:
+                pack_into(buf, n, 0, 0, EV_ABS, ABS_Y, screen_y)
+                n += size
+                self._sent_y = screen_y
             
             # Send pressure if available
-            try:
-                self.uinput.write(ecodes.EV_ABS, ecodes.ABS_PRESSURE, pressure)
-            except:
-                pass  # Pressure might not be available in fallback mode
+            if self._has_pressure and pressure != self._sent_pressure:
+                pack_into(buf, n, 0, 0, EV_ABS, ABS_PRESSURE, pressure)
+                n += size
+                self._sent_pressure = pressure
             
             # Handle touch events (clicks only when touching surface)
             # Also send stylus button state for applications that can use it
-            if self.button_pressed != self.was_button_pressed:
-                self.uinput.write(ecodes.EV_KEY, ecodes.BTN_STYLUS, 1 if self.button_pressed else 0)
+            if button_changed:
+                pack_into(buf, n, 0, 0, EV_KEY, BTN_STYLUS, 1 if button else 0)
+                n += size
             
-            if self.is_touching and not self.was_touching:
+            if just_touched:
                 # Pen just touched the surface - start click
-                self.uinput.write(ecodes.EV_KEY, ecodes.BTN_TOUCH, 1)
+                pack_into(buf, n, 0, 0, EV_KEY, BTN_TOUCH, 1)
+                n += size
                 if self.verbose:
-                    button_info = " (with button)" if self.button_pressed else ""
+                    button_info = " (with button)" if button else ""
                     print(f"Stylus DOWN{button_info} at ({screen_x}, {screen_y}) pressure: {pressure}")
-            elif not self.is_touching and self.was_touching:
+            elif just_released:
                 # Pen lifted from surface - end click
-                self.uinput.write(ecodes.EV_KEY, ecodes.BTN_TOUCH, 0)
+                pack_into(buf, n, 0, 0, EV_KEY, BTN_TOUCH, 0)
+                n += size
                 if self.verbose:
                     print(f"Stylus UP at ({screen_x}, {screen_y})")
-            elif self.is_touching:
-                # Pen dragging on surface
-                if self.verbose:
-                    button_info = " (with button)" if self.button_pressed else ""
-                    print(f"Stylus DRAG{button_info} at ({screen_x}, {screen_y}) pressure: {pressure}")
-            else:
-                # Pen hovering above surface
-                if self.verbose:
-                    button_info = " (with button)" if self.button_pressed else ""
-                    print(f"Stylus HOVER{button_info} at ({screen_x}, {screen_y})")
+            # Dragging and hovering are not logged, they occur on every sample
         else:
-            # Mouse mode with relative movement
-            # Calculate relative movement with proper scaling
-            rel_x, rel_y = self.calculate_relative_movement(x, y)
-            
+            # Mouse mode with absolute positioning
             # Send movement events whenever the stylus moves (hovering or touching)
-            if rel_x != 0 or rel_y != 0:
-                self.uinput.write(ecodes.EV_REL, ecodes.REL_X, rel_x)
-                self.uinput.write(ecodes.EV_REL, ecodes.REL_Y, rel_y)
+            if screen_x != self._sent_x:
+                pack_into(buf, n, 0, 0, EV_ABS, ABS_X, screen_x)
+                n += size
+                self._sent_x = screen_x
+            if screen_y != self._sent_y:
+                pack_into(buf, n, 0, 0, EV_ABS, ABS_Y, screen_y)
+                n += size
+                self._sent_y = screen_y
             
             # Handle mouse clicks (only when touching surface)
             # Determine which mouse button to use based on stylus button state
-            mouse_button = ecodes.BTN_RIGHT if self.button_pressed else ecodes.BTN_LEFT
-            button_name = "RIGHT" if self.button_pressed else "LEFT"
+            mouse_button = BTN_RIGHT if button else BTN_LEFT
             
-            if self.is_touching and not self.was_touching:
+            if just_touched:
                 # Start click
-                self.uinput.write(ecodes.EV_KEY, mouse_button, 1)
+                pack_into(buf, n, 0, 0, EV_KEY, mouse_button, 1)
+                n += size
                 self.mouse_button_pressed = True
                 if self.verbose:
+                    button_name = "RIGHT" if button else "LEFT"
                     print(f"Mouse {button_name} DOWN at ({screen_x}, {screen_y}) pressure: {pressure}")
-            elif not self.is_touching and self.was_touching:
+            elif just_released:
                 # End click - use the button that was active when click started
                 # For simplicity, release both buttons to handle button state changes during click
                 if self.mouse_button_pressed:
-                    self.uinput.write(ecodes.EV_KEY, ecodes.BTN_LEFT, 0)
-                    self.uinput.write(ecodes.EV_KEY, ecodes.BTN_RIGHT, 0)
+                    pack_into(buf, n, 0, 0, EV_KEY, BTN_LEFT, 0)
+                    n += size
+                    pack_into(buf, n, 0, 0, EV_KEY, BTN_RIGHT, 0)
+                    n += size
                     self.mouse_button_pressed = False
                 if self.verbose:
                     print(f"Mouse UP at ({screen_x}, {screen_y})")
-            elif self.is_touching:
+            elif touching:
                 # Handle button state changes during drag
-                if self.button_pressed != self.was_button_pressed and self.mouse_button_pressed:
+                if button_changed and self.mouse_button_pressed:
                     # Button state changed while dragging - switch button type
                     # Release old button, press new button
-                    old_button = ecodes.BTN_LEFT if self.button_pressed else ecodes.BTN_RIGHT
-                    new_button = ecodes.BTN_RIGHT if self.button_pressed else ecodes.BTN_LEFT
-                    self.uinput.write(ecodes.EV_KEY, old_button, 0)
-                    self.uinput.write(ecodes.EV_KEY, new_button, 1)
+                    old_button = BTN_LEFT if button else BTN_RIGHT
+                    new_button = BTN_RIGHT if button else BTN_LEFT
+                    pack_into(buf, n, 0, 0, EV_KEY, old_button, 0)
+                    n += size
+                    pack_into(buf, n, 0, 0, EV_KEY, new_button, 1)
+                    n += size
                     if self.verbose:
-                        new_button_name = "RIGHT" if self.button_pressed else "LEFT"
+                        new_button_name = "RIGHT" if button else "LEFT"
                         print(f"Switched to {new_button_name} button during drag")
-                
-                # Dragging with button held
-                if self.verbose:
-                    print(f"Mouse {button_name} DRAG at ({screen_x}, {screen_y}) pressure: {pressure}")
-            else:
-                # Hovering - cursor moves but no click
-                if rel_x != 0 or rel_y != 0:
-                    if self.verbose:
-                        print(f"Mouse HOVER at ({screen_x}, {screen_y})")
+            # Dragging and hovering are not logged, they occur on every sample
                     
-        # Synchronize the event
-        self.uinput.syn()
+        # Synchronize the event and write the whole frame at once
+        pack_into(buf, n, 0, 0, 0, 0, 0)  # EV_SYN / SYN_REPORT
+        os.write(self._uifd, self._outview[:n + size])
+
+    def flush_held_hover(self):
+        """Send the hover frame held back by the throttle once its interval has passed."""
+        self._hover_timer = None
+        held = self._held_hover
+        if held is not None:
+            self._held_hover = None
+            self.process_stylus_event(*held)
+
+    def cancel_held_hover(self):
+        """Discard a held hover frame, superseded by a frame that is sent or dropped."""
+        self._held_hover = None
+        if self._hover_timer is not None:
+            self._hover_timer.cancel()
+            self._hover_timer = None
+
+    async def connect_native(self):
+        """Open a native SSH connection, or return None to fall back to the ssh client."""
+        try:
+            # AES-GCM is preferred as it runs on AES-NI; the other ciphers are fallbacks
+            # for older sshd builds on the tablet
+            return await asyncssh.connect(
+                self._ssh_host,
+                username=self._ssh_user,
+                known_hosts=None,
+                connect_timeout=5,
+                keepalive_interval=15,
+                compression_algs=['none'],
+                encryption_algs=['aes128-gcm@openssh.com', 'chacha20-poly1305@openssh.com', 'aes128-ctr']
+            )
+        except (asyncssh.DisconnectError, asyncssh.KeyImportError) as e:
+            # asyncssh cannot prompt for a password or key passphrase; the ssh client can
+            print(f"Native SSH connection failed ({e}), falling back to the ssh client")
+            return None
 
     async def read_remarkable_data(self):
         """Read pen/stylus data from reMarkable tablet via SSH connection."""
-        command = f"ssh -o ConnectTimeout=5 -o StrictHostKeyChecking=no {self.rm_host} cat {self.device_path}"
-        
         if self.verbose:
             print(f"Connecting to reMarkable at {self.rm_host}...")
         
+        loop = asyncio.get_running_loop()
+        read_fd = None
         try:
-            self._process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            if self.verbose:
-                print("Connected! Move your stylus on the reMarkable tablet.")
-                print("Press Ctrl+C to stop.")
-            
-            # Read data in 16-byte chunks (reMarkable input event structure)
-            while self._running and self._process.returncode is None:
+            conn = await self.connect_native() if asyncssh is not None else None
+            if conn is not None:
+                # Native SSH client: events are read straight from the SSH channel, no ssh
+                # process or pipe in between
+                async with conn:
+                    async with conn.create_process(
+                        f"cat {self.device_path}",
+                        encoding=None,
+                        stderr=asyncssh.DEVNULL
+                    ) as process:
+                        if self.verbose:
+                            print("Connected! Move your stylus on the reMarkable tablet.")
+                            print("Press Ctrl+C to stop.")
+                        await self.read_stream(process.stdout)
+            else:
+                # Low-latency SSH settings for a stream of small pen events: no PTY (-T) on the binary
+                # stream, low-delay IP QoS, no compression, and keepalives to detect a dropped link
+                command = (
+                    f"ssh -T -o ConnectTimeout=5 -o StrictHostKeyChecking=no"
+                    f" -o IPQoS=lowdelay -o Compression=no -o ServerAliveInterval=15 -o TCPKeepAlive=yes"
+                    f" {self.rm_host} cat {self.device_path}"
+                )
+                
+                # ssh writes into a pipe we own, so the event loop can watch its read end directly
+                read_fd, write_fd = os.pipe()
                 try:
-                    data = await asyncio.wait_for(self._process.stdout.read(16), timeout=1.0)
-                    
-                    if len(data) != 16:
-                        if len(data) == 0:
-                            if self.verbose:
-                                print("Connection closed by reMarkable")
-                            break
-                        continue
-                    
-                    # Parse reMarkable input event structure
-                    # Based on Linux input_event structure
-                    timestamp = data[0:8]  # struct timeval (8 bytes)
-                    type_code = data[8:10]  # __u16 type (2 bytes)
-                    code = data[10:12]     # __u16 code (2 bytes)
-                    value = data[12:16]    # __s32 value (4 bytes)
-                    
-                    # Unpack the values
-                    event_type = struct.unpack('<H', type_code)[0]
-                    event_code = struct.unpack('<H', code)[0]
-                    event_value = struct.unpack('<i', value)[0]
-                    
-                    # Process absolute position events (type 3)
-                    if event_type == 3:  # EV_ABS
-                        if event_code == 0:    # ABS_X
-                            self.x = event_value
-                            # Process stylus event on X coordinate update (for hovering)
-                            self.process_stylus_event(self.x, self.y, self.pressure)
-                        elif event_code == 1:  # ABS_Y
-                            self.y = event_value
-                            # Process stylus event on Y coordinate update (for hovering)
-                            self.process_stylus_event(self.x, self.y, self.pressure)
-                        elif event_code == 24: # ABS_PRESSURE
-                            self.pressure = event_value
-                            # Process stylus event on pressure update (for touching)
-                            self.process_stylus_event(self.x, self.y, self.pressure)
-                    
-                    # Process key events (type 1) for button presses
-                    elif event_type == 1:  # EV_KEY
-                        if event_code == 331:  # BTN_STYLUS (stylus button)
-                            self.was_button_pressed = self.button_pressed
-                            self.button_pressed = event_value == 1
-                            if self.verbose:
-                                button_state = "PRESSED" if self.button_pressed else "RELEASED"
-                                print(f"Stylus button {button_state}")
-                            # Process stylus event on button state change
-                            self.process_stylus_event(self.x, self.y, self.pressure)
+                    self._process = await asyncio.create_subprocess_shell(
+                        command,
+                        stdout=write_fd,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                finally:
+                    os.close(write_fd)
+                os.set_blocking(read_fd, False)
                 
-                except asyncio.TimeoutError:
-                    # Timeout is normal, just continue
-                    continue
-                except Exception as e:
-                    if self.verbose:
-                        print(f"Error reading data: {e}")
-                    break
+                if self.verbose:
+                    print("Connected! Move your stylus on the reMarkable tablet.")
+                    print("Press Ctrl+C to stop.")
+                
+                # Events are handled synchronously whenever the pipe is readable, until EOF
+                self._stream_closed = loop.create_future()
+                loop.add_reader(read_fd, self.drain_pipe, read_fd)
+                await self._stream_closed
                     
         except Exception as e:
             print(f"ERROR: Failed to connect to reMarkable: {e}")
         finally:
+            if read_fd is not None:
+                loop.remove_reader(read_fd)
+                os.close(read_fd)
             if self._process:
                 self._process.kill()
                 await self._process.wait()
 
+    async def read_stream(self, stream):
+        """Read pen events from the asyncssh channel until it closes."""
+        while self._running:
+            try:
+                data = await stream.read(_READ_SIZE)
+                if len(data) == 0:
+                    if self.verbose:
+                        print("Connection closed by reMarkable")
+                    break
+                self.process_events(data)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error reading data: {e}")
+                break
+
+    def drain_pipe(self, fd: int):
+        """Read the pen events available on the SSH pipe (called by the event loop)."""
+        try:
+            data = os.read(fd, _READ_SIZE)
+            if len(data) == 0:
+                if self.verbose:
+                    print("Connection closed by reMarkable")
+            elif self._running:
+                self.process_events(data)
+                return
+        except BlockingIOError:
+            return  # Spurious wakeup, nothing to read yet
+        except Exception as e:
+            if self.verbose:
+                print(f"Error reading data: {e}")
+        
+        # End of stream, error or shutdown: stop reading
+        if not self._stream_closed.done():
+            self._stream_closed.set_result(None)
+
+    def process_events(self, data: bytes):
+        """Process a batch of raw input events; a trailing partial event is kept for the next batch."""
+        if self._pending:
+            data = self._pending + data
+        end = len(data) - len(data) % _EVENT.size
+        self._pending = data[end:]
+        
+        view = memoryview(data)
+        motion = None  # State of the last motion-only frame, sent at the end of the batch
+        for offset in range(0, end, _EVENT.size):
+            # Parse reMarkable input event structure in a single call
+            event_type, event_code, event_value = _EVENT.unpack_from(view, offset)
+            
+            # Sub-events only update the stylus state; it is sent once per frame
+            # Process absolute position events (type 3)
+            if event_type == 3:  # EV_ABS
+                if event_code == 0:    # ABS_X
+                    self.x = event_value
+                    self._frame_changed = True
+                elif event_code == 1:  # ABS_Y
+                    self.y = event_value
+                    self._frame_changed = True
+                elif event_code == 24: # ABS_PRESSURE
+                    self.pressure = event_value
+                    self._frame_changed = True
+            
+            # Process key events (type 1) for button presses
+            elif event_type == 1:  # EV_KEY
+                if event_code == 331:  # BTN_STYLUS (stylus button)
+                    self.button_pressed = event_value == 1
+                    if self.verbose:
+                        button_state = "PRESSED" if self.button_pressed else "RELEASED"
+                        print(f"Stylus button {button_state}")
+                    self._frame_changed = True
+            
+            # SYN_REPORT (type 0, code 0) closes a frame: process its combined state once
+            elif event_type == 0 and event_code == 0 and self._frame_changed:
+                self._frame_changed = False
+                if (self.pressure > 0) != self._last_touching or self.button_pressed != self._last_button:
+                    # Touch and button changes are sent right away so no click is lost
+                    self.process_stylus_event(self.x, self.y, self.pressure, self.button_pressed)
+                    motion = None
+                else:
+                    # Saved at SYN_REPORT: the live state may already hold part of the next frame
+                    motion = (self.x, self.y, self.pressure, self.button_pressed)
+        
+        # Frames that only move the pen are coalesced: the batch's latest complete frame is sent once
+        if motion is not None:
+            self.process_stylus_event(*motion)
+
     async def run(self):
         """Main run loop - connects to reMarkable and starts processing input events."""
         self._running = True
@@ -501,17 +705,19 @@ class RemarkableMouse:
     def cleanup(self):
         """Clean up resources and close virtual input device."""
         self._running = False
+        self.cancel_held_hover()
         
         if self.uinput:
             # Send stylus tool away event (if in stylus mode)
             try:
-                device_name = getattr(self.uinput, 'name', 'Unknown')
-                if 'Pen' in device_name:
+                if self._is_pen_mode and self._has_tool_pen:
                     self.uinput.write(ecodes.EV_KEY, ecodes.BTN_TOOL_PEN, 0)
                     self.uinput.syn()
             except:
                 pass  # Ignore errors during cleanup
             
+            # Stop frame writes before the descriptor is closed (and its number possibly reused)
+            self._uifd = -1
             self.uinput.close()
             if self.verbose:
                 print("Virtual device closed")
@@ -535,12 +741,17 @@ async def main():
         '--sensitivity', '-s',
         type=float,
         default=1.0,
-        help='Mouse sensitivity multiplier (default: 1.0)'
+        help='Deprecated, has no effect: the pointer follows the pen absolutely'
+    )
+    parser.add_argument(
+        '--uniform-scaling',
+        action='store_true',
+        help='Keep the tablet aspect ratio: map it to a centered area of the screen instead of the full screen'
     )
     parser.add_argument(
         '--no-uniform-scaling',
         action='store_true',
-        help='Disable uniform scaling (may cause distortion but covers full screen)'
+        help='Deprecated, has no effect: the full screen is covered by default'
     )
     parser.add_argument(
         '--remarkable-version',
@@ -568,11 +779,9 @@ async def main():
     
     # Create and run the virtual mouse/stylus
     mouse = RemarkableMouse(args.host, getattr(args, 'remarkable_version'), verbose=args.verbose, flip_orientation=args.flip)
-    mouse.mouse_sensitivity = args.sensitivity
-    mouse.uniform_scaling = not args.no_uniform_scaling
+    mouse.uniform_scaling = args.uniform_scaling
     
     if args.verbose:
-        print(f"Mouse sensitivity: {mouse.mouse_sensitivity}")
         print(f"Uniform scaling: {mouse.uniform_scaling}")
         orientation = "original" if args.flip else "flipped (default)"
         print(f"Orientation: {orientation}")
@@ -586,4 +795,7 @@ async def main():
 if __name__ == "__main__":
     print("reMarkable Mouse - Virtual Mouse from reMarkable Tablet")
     print("===================================================================")
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())